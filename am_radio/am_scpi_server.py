@@ -23,11 +23,15 @@ Register Map (when Bowen updates Verilog):
 Author: William Park
 Date: January 2026
 """
+import functools
+import logging
 import socket
 import mmap
 import os
+import selectors
 import struct
 import subprocess
+import sys
 import threading
 import time
 
@@ -65,15 +69,18 @@ REG_CH12_FREQ = 0x30
 REG_CH_ENABLE = 0x34
 REG_STATUS    = 0x38
 
-# Channel freq register lookup (channel 1-12)
-CH_FREQ_REGS = {
-    1: REG_CH1_FREQ,   2: REG_CH2_FREQ,
-    3: REG_CH3_FREQ,   4: REG_CH4_FREQ,
-    5: REG_CH5_FREQ,   6: REG_CH6_FREQ,
-    7: REG_CH7_FREQ,   8: REG_CH8_FREQ,
-    9: REG_CH9_FREQ,   10: REG_CH10_FREQ,
-    11: REG_CH11_FREQ, 12: REG_CH12_FREQ,
-}
+# Channel freq register lookup (channel 1-12, indexed by channel - 1)
+CH_FREQ_REGS = (
+    REG_CH1_FREQ,  REG_CH2_FREQ,  REG_CH3_FREQ,  REG_CH4_FREQ,
+    REG_CH5_FREQ,  REG_CH6_FREQ,  REG_CH7_FREQ,  REG_CH8_FREQ,
+    REG_CH9_FREQ,  REG_CH10_FREQ, REG_CH11_FREQ, REG_CH12_FREQ,
+)
+
+# Per-channel command strings (channel 1-12), built once at import
+CH_OUTPUT_CMDS = tuple(("CH%d:OUTPUT ON" % ch, "CH%d:OUTPUT OFF" % ch)
+                       for ch in range(1, 13))
+CH_FREQ_HEADERS = tuple(("CH%d:FREQ" % ch, "FREQ:CH%d" % ch)
+                        for ch in range(1, 13))
 
 # Control register bits
 CTRL_MASTER_EN = 0
@@ -83,6 +90,37 @@ CTRL_WATCHDOG_EN = 4
 
 FPGA_CLK_HZ = 125000000
 
+# Per-command / per-register tracing goes to DEBUG (set AM_RADIO_DEBUG=1 to see it)
+log = logging.getLogger("am_scpi")
+
+# 32-bit little-endian register word (compiled once, not per access)
+_U32 = struct.Struct('<I')
+
+# TCP keepalive for GUI connections (seconds). A dead GUI link is
+# detected by the kernel after ~IDLE + INTVL * CNT, which closes the
+# connection. Heartbeats continue while any other client is connected;
+# once none is left they stop and the FPGA watchdog fires.
+KEEPALIVE_IDLE = 2
+KEEPALIVE_INTVL = 1
+KEEPALIVE_CNT = 3
+
+# Seconds between FPGA watchdog heartbeats while a GUI is connected
+HEARTBEAT_INTERVAL = 2
+
+# Per-client limits (bytes). A client whose unterminated line or unsent
+# replies grow past these is dropped, so it can't stall or bloat the loop.
+MAX_LINE_LEN = 4096
+MAX_PENDING_REPLY = 65536
+
+
+def enable_keepalive(sock):
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Tuning options are Linux-only
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTVL)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_CNT)
+
 
 class FPGARegs:
     def __init__(self, base_addr=FPGA_BASE, size=FPGA_SIZE):
@@ -115,12 +153,10 @@ class FPGARegs:
             os.close(self.fd)
 
     def read32(self, offset):
-        self.mem.seek(offset)
-        return struct.unpack('<I', self.mem.read(4))[0]
+        return _U32.unpack_from(self.mem, offset)[0]
 
     def write32(self, offset, value):
-        self.mem.seek(offset)
-        self.mem.write(struct.pack('<I', value & 0xFFFFFFFF))
+        _U32.pack_into(self.mem, offset, value & 0xFFFFFFFF)
 
 
 class AMRadioController:
@@ -139,16 +175,35 @@ class AMRadioController:
         self.audio_loading = False
         self.audio_loader_thread = None
 
+        # Last value written to each register (offset -> value); unset = unknown
+        self.reg_written = {}
+
+        self._exact, self._with_arg = self._build_dispatch()
+
+    def write_reg(self, offset, value):
+        """Write a register unless the last write there had the same value."""
+        # The heartbeat writes REG_CTRL through fpga.write32 directly and is
+        # never skipped; it keeps the watchdog fed on its own.
+        if self.fpga and self.reg_written.get(offset) != value:
+            self.fpga.write32(offset, value)
+            self.reg_written[offset] = value
+
+    def forget_written_regs(self):
+        """Forget cached writes so the next write to each register goes out."""
+        # The FPGA may have been reloaded or reset behind our back - called on
+        # every new client and on OUTPUT:STATE ON so each session rewrites it.
+        self.reg_written.clear()
+
     def freq_to_phase_inc(self, freq_hz):
-        return int((freq_hz * (1 << 32)) / FPGA_CLK_HZ) & 0xFFFFFFFF
+        # Integer floor division: exact for any freq, no float rounding
+        return ((freq_hz << 32) // FPGA_CLK_HZ) & 0xFFFFFFFF
 
     def set_ctrl_bit(self, bit, value):
         if value:
             self.ctrl_shadow |= (1 << bit)
         else:
             self.ctrl_shadow &= ~(1 << bit)
-        if self.fpga:
-            self.fpga.write32(REG_CTRL, self.ctrl_shadow)
+        self.write_reg(REG_CTRL, self.ctrl_shadow)
 
     def set_channel_enable(self, ch_num, enabled):
         """Enable/disable channel 1-12."""
@@ -158,18 +213,17 @@ class AMRadioController:
                 self.ch_enable_shadow |= (1 << bit)
             else:
                 self.ch_enable_shadow &= ~(1 << bit)
-            if self.fpga:
-                self.fpga.write32(REG_CH_ENABLE, self.ch_enable_shadow)
-            print("CH%d: %s (mask=0b%s)" % (ch_num, "ON" if enabled else "OFF", bin(self.ch_enable_shadow)[2:].zfill(12)))
+            self.write_reg(REG_CH_ENABLE, self.ch_enable_shadow)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("CH%d: %s (mask=0b%s)", ch_num, "ON" if enabled else "OFF", bin(self.ch_enable_shadow)[2:].zfill(12))
 
     def set_channel_freq(self, ch_num, freq_hz):
         """Set channel frequency."""
-        if ch_num in CH_FREQ_REGS:
+        if 1 <= ch_num <= 12:
             phase_inc = self.freq_to_phase_inc(freq_hz)
             self.ch_freqs[ch_num] = freq_hz
-            if self.fpga:
-                self.fpga.write32(CH_FREQ_REGS[ch_num], phase_inc)
-            print("CH%d: %d Hz -> phase_inc=0x%08X" % (ch_num, freq_hz, phase_inc))
+            self.write_reg(CH_FREQ_REGS[ch_num - 1], phase_inc)
+            log.debug("CH%d: %d Hz -> phase_inc=0x%08X", ch_num, freq_hz, phase_inc)
 
     def load_audio_file(self, msg_id):
         """Load audio file in background thread."""
@@ -246,145 +300,183 @@ class AMRadioController:
 
         return ";".join(parts)
 
-    def process_command(self, cmd):
-        cmd = cmd.strip().upper()
-
-        # Identity
-        if cmd == "*IDN?":
-            return "RedPitaya,AMRadio-12CH,v2.0"
-
-        # Status query
-        if cmd == "STATUS?":
-            return self.get_status()
-
-        if cmd == "SYST:STAT?":
-            if self.fpga:
-                status = self.fpga.read32(REG_STATUS)
-                return "0x%08X" % status
-            return "0x00000000"
-
-        # Master enable
-        if cmd == "OUTPUT:STATE ON":
-            self.set_ctrl_bit(CTRL_MASTER_EN, True)
-            self.set_ctrl_bit(CTRL_WATCHDOG_EN, True)
-            print("BROADCAST: ON")
-            return "OK"
-        if cmd == "OUTPUT:STATE OFF":
-            self.set_ctrl_bit(CTRL_MASTER_EN, False)
-            print("BROADCAST: OFF")
-            return "OK"
+    def _build_dispatch(self):
+        """Build (exact command -> handler, header -> handler(arg)) tables."""
+        exact = {
+            "*IDN?": lambda: "RedPitaya,AMRadio-12CH,v2.0",
+            "STATUS?": self.get_status,
+            "SYST:STAT?": self._cmd_syst_stat,
+            "OUTPUT:STATE ON": self._cmd_output_on,
+            "OUTPUT:STATE OFF": self._cmd_output_off,
+            "SOURCE:INPUT ADC": self._cmd_source_adc,
+            "SOURCE:INPUT BRAM": self._cmd_source_bram,
+            "WATCHDOG:STATUS?": lambda: "watchdog_enabled=1;watchdog_triggered=0;watchdog_time=5",
+            "WATCHDOG:RESET": self._cmd_watchdog_reset,
+            "AUDIO:STATUS?": self._cmd_audio_status,
+        }
+        with_arg = {
+            "CH:EN": self._cmd_ch_en,
+            "SOURCE:MSG": self._cmd_source_msg,
+            "WATCHDOG:ENABLE": lambda arg: "OK",
+            "AUDIO:LOAD": self._cmd_audio_load,
+        }
 
         # Channel enable/disable: CH1:OUTPUT ON, CH12:OUTPUT OFF
-        for ch in range(1, 13):
-            if cmd == "CH%d:OUTPUT ON" % ch:
-                self.set_channel_enable(ch, True)
-                return "OK"
-            if cmd == "CH%d:OUTPUT OFF" % ch:
-                self.set_channel_enable(ch, False)
-                return "OK"
+        for ch, (on_cmd, off_cmd) in enumerate(CH_OUTPUT_CMDS, 1):
+            exact[on_cmd] = functools.partial(self._cmd_channel_output, ch, True)
+            exact[off_cmd] = functools.partial(self._cmd_channel_output, ch, False)
 
         # Channel frequency: CH1:FREQ 540000 or FREQ:CH1 540000
-        for ch in range(1, 13):
-            prefix1 = "CH%d:FREQ " % ch
-            prefix2 = "FREQ:CH%d " % ch
+        for ch, headers in enumerate(CH_FREQ_HEADERS, 1):
+            for header in headers:
+                with_arg[header] = functools.partial(self._cmd_channel_freq, ch)
 
-            if cmd.startswith(prefix1):
-                try:
-                    freq = int(cmd.split()[1])
-                    self.set_channel_freq(ch, freq)
-                    return "OK"
-                except:
-                    return "ERROR"
+        return exact, with_arg
 
-            if cmd.startswith(prefix2):
-                try:
-                    freq = int(cmd.split()[1])
-                    self.set_channel_freq(ch, freq)
-                    return "OK"
-                except:
-                    return "ERROR"
-
-        # Bulk channel enable: CH:EN 0b000000001111 or CH:EN 15
-        if cmd.startswith("CH:EN "):
-            try:
-                val_str = cmd.split()[1]
-                if val_str.startswith("0B"):
-                    mask = int(val_str, 2)
-                elif val_str.startswith("0X"):
-                    mask = int(val_str, 16)
-                else:
-                    mask = int(val_str)
-                self.ch_enable_shadow = mask & 0xFFF
-                if self.fpga:
-                    self.fpga.write32(REG_CH_ENABLE, self.ch_enable_shadow)
-                print("CH:EN mask=0b%s" % bin(self.ch_enable_shadow)[2:].zfill(12))
-                return "OK"
-            except:
-                return "ERROR"
-
-        # Audio source
-        if cmd == "SOURCE:INPUT ADC":
-            self.set_ctrl_bit(CTRL_SOURCE, True)
-            print("Source: ADC (live mic)")
+    def process_command(self, cmd):
+        cmd = cmd.strip().upper()
+
+        handler = self._exact.get(cmd)
+        if handler:
+            return handler()
+
+        header, _, arg = cmd.partition(" ")
+        handler = self._with_arg.get(header)
+        arg = arg.strip()
+        if handler and arg:
+            return handler(arg)
+
+        print("Unknown command: %s" % cmd)
+        return "ERROR"
+
+    def _cmd_syst_stat(self):
+        if self.fpga:
+            status = self.fpga.read32(REG_STATUS)
+            return "0x%08X" % status
+        return "0x00000000"
+
+    # Master enable
+    def _cmd_output_on(self):
+        self.forget_written_regs()
+        self.set_ctrl_bit(CTRL_MASTER_EN, True)
+        self.set_ctrl_bit(CTRL_WATCHDOG_EN, True)
+        print("BROADCAST: ON")
+        return "OK"
+
+    def _cmd_output_off(self):
+        self.set_ctrl_bit(CTRL_MASTER_EN, False)
+        print("BROADCAST: OFF")
+        return "OK"
+
+    def _cmd_channel_output(self, ch, enabled):
+        self.set_channel_enable(ch, enabled)
+        return "OK"
+
+    def _cmd_channel_freq(self, ch, arg):
+        try:
+            freq = int(arg.split()[0])
+            self.set_channel_freq(ch, freq)
             return "OK"
-        if cmd == "SOURCE:INPUT BRAM":
-            self.set_ctrl_bit(CTRL_SOURCE, False)
-            print("Source: BRAM (stored audio)")
+        except:
+            return "ERROR"
+
+    # Bulk channel enable: CH:EN 0b000000001111 or CH:EN 15
+    def _cmd_ch_en(self, arg):
+        try:
+            val_str = arg.split()[0]
+            if val_str.startswith("0B"):
+                mask = int(val_str, 2)
+            elif val_str.startswith("0X"):
+                mask = int(val_str, 16)
+            else:
+                mask = int(val_str)
+            self.ch_enable_shadow = mask & 0xFFF
+            self.write_reg(REG_CH_ENABLE, self.ch_enable_shadow)
+            print("CH:EN mask=0b%s" % bin(self.ch_enable_shadow)[2:].zfill(12))
             return "OK"
+        except:
+            return "ERROR"
+
+    # Audio source
+    def _cmd_source_adc(self):
+        self.set_ctrl_bit(CTRL_SOURCE, True)
+        print("Source: ADC (live mic)")
+        return "OK"
+
+    def _cmd_source_bram(self):
+        self.set_ctrl_bit(CTRL_SOURCE, False)
+        print("Source: BRAM (stored audio)")
+        return "OK"
+
+    # Message select - TRIGGERS AUDIO LOADING
+    def _cmd_source_msg(self, arg):
+        try:
+            msg_id = int(arg.split()[0])
 
-        # Message select - TRIGGERS AUDIO LOADING
-        if cmd.startswith("SOURCE:MSG "):
-            try:
-                msg_id = int(cmd.split()[1])
+            # Update control register
+            self.ctrl_shadow &= ~(0xF << CTRL_MSG_SHIFT)
+            self.ctrl_shadow |= ((msg_id & 0xF) << CTRL_MSG_SHIFT)
+            self.write_reg(REG_CTRL, self.ctrl_shadow)
 
-                # Update control register
-                self.ctrl_shadow &= ~(0xF << CTRL_MSG_SHIFT)
-                self.ctrl_shadow |= ((msg_id & 0xF) << CTRL_MSG_SHIFT)
-                if self.fpga:
-                    self.fpga.write32(REG_CTRL, self.ctrl_shadow)
+            self.current_msg = msg_id
+            print("Message selected: %d" % msg_id)
 
-                self.current_msg = msg_id
-                print("Message selected: %d" % msg_id)
+            # Trigger audio loading in background
+            if self.load_audio_file(msg_id):
+                return "OK:LOADING"
+            else:
+                return "OK:NO_FILE"
+        except:
+            return "ERROR"
+
+    # Watchdog (stub)
+    def _cmd_watchdog_reset(self):
+        log.debug("Watchdog reset")
+        return "OK"
 
-                # Trigger audio loading in background
-                if self.load_audio_file(msg_id):
+    # Audio status query
+    def _cmd_audio_status(self):
+        return "loading=%d;msg=%d" % (1 if self.audio_loading else 0, self.current_msg)
+
+    # Direct audio load command: AUDIO:LOAD /path/to/file.wav
+    def _cmd_audio_load(self, filepath):
+        try:
+            if os.path.exists(filepath):
+                # Temporarily add to AUDIO_FILES and load
+                AUDIO_FILES[99] = filepath
+                if self.load_audio_file(99):
                     return "OK:LOADING"
                 else:
-                    return "OK:NO_FILE"
-            except:
-                return "ERROR"
-
-        # Watchdog (stub)
-        if cmd == "WATCHDOG:STATUS?":
-            return "watchdog_enabled=1;watchdog_triggered=0;watchdog_time=5"
-        if cmd == "WATCHDOG:RESET":
-            print("Watchdog reset")
-            return "OK"
-        if cmd.startswith("WATCHDOG:ENABLE "):
-            return "OK"
+                    return "ERROR:BUSY"
+            else:
+                return "ERROR:FILE_NOT_FOUND"
+        except:
+            return "ERROR"
 
-        # Audio status query
-        if cmd == "AUDIO:STATUS?":
-            return "loading=%d;msg=%d" % (1 if self.audio_loading else 0, self.current_msg)
 
-        # Direct audio load command: AUDIO:LOAD /path/to/file.wav
-        if cmd.startswith("AUDIO:LOAD "):
-            try:
-                filepath = cmd.split(None, 1)[1]
-                if os.path.exists(filepath):
-                    # Temporarily add to AUDIO_FILES and load
-                    AUDIO_FILES[99] = filepath
-                    if self.load_audio_file(99):
-                        return "OK:LOADING"
-                    else:
-                        return "ERROR:BUSY"
-                else:
-                    return "ERROR:FILE_NOT_FOUND"
-            except:
-                return "ERROR"
+def handle_client_data(controller, buf, data):
+    """Process complete lines in buf + data; return (leftover, reply bytes)."""
+    # Handle multiple commands (last piece may be incomplete)
+    lines = (buf + data).split(b'\n')
+    buf = lines.pop()
 
-        print("Unknown command: %s" % cmd)
-        return "ERROR"
+    responses = []
+    for line in lines:
+        line = line.decode().strip()
+        if not line:
+            continue
+
+        log.debug("[RX] %s", line)
+        response = controller.process_command(line)
+
+        if "?" in line:
+            responses.append(response)
+            log.debug("[TX] %s", response)
+
+    # One send for all queries answered in this batch
+    if responses:
+        return buf, ("\n".join(responses) + "\n").encode()
+    return buf, b""
 
 
 def run_server(host="0.0.0.0", port=5000):
@@ -401,7 +493,7 @@ def run_server(host="0.0.0.0", port=5000):
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server.bind((host, port))
-    server.listen(1)
+    server.listen(5)
 
     print("=" * 50)
     print("AM RADIO SCPI SERVER (12-Channel)")
@@ -424,56 +516,125 @@ def run_server(host="0.0.0.0", port=5000):
     print("Waiting for GUI connection...")
     print("=" * 50)
 
+    # One thread serves every GUI connection. The heartbeat runs on the same
+    # loop (no read-modify-write race with commands) while any client is
+    # connected; with none, the FPGA watchdog is allowed to fire. Sockets are
+    # non-blocking and replies are queued per client, so a GUI that stops
+    # reading can't hold up the others or the heartbeat.
+    server.setblocking(False)
+    sel = selectors.DefaultSelector()
+    sel.register(server, selectors.EVENT_READ)
+    clients = {}  # conn -> partial line carried over between recv() calls
+    outbox = {}   # conn -> reply bytes the socket hasn't accepted yet
+    last_heartbeat = time.monotonic()
+
+    def drop_client(conn, process_partial=True):
+        partial = clients.pop(conn)
+        del outbox[conn]
+        sel.unregister(conn)
+        conn.close()
+        print("[DISCONNECTED]\n")
+
+        # A last command without its newline still takes effect (no reply -
+        # the peer is gone), as it did when every recv() was processed whole
+        if process_partial and partial.strip():
+            try:
+                handle_client_data(controller, partial, b"\n")
+            except Exception as e:
+                print("[ERROR] %s" % str(e))
+
+    def flush_outbox(conn):
+        """Send what the socket takes now; watch for writability if any is left."""
+        try:
+            sent = conn.send(outbox[conn])
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        outbox[conn] = outbox[conn][sent:]
+        if len(outbox[conn]) > MAX_PENDING_REPLY:
+            print("[ERROR] Client not reading replies, dropping it")
+            drop_client(conn)
+            return
+        events = selectors.EVENT_READ
+        if outbox[conn]:
+            events |= selectors.EVENT_WRITE
+        sel.modify(conn, events)
+
     try:
         while True:
-            conn, addr = server.accept()
-            print("\n[CONNECTED] %s" % str(addr))
-            client_connected = [True]
-
-            def heartbeat():
-                while client_connected[0]:
-                    if fpga:
-                        current = fpga.read32(REG_CTRL)
-                        fpga.write32(REG_CTRL, current)
-                    time.sleep(2)
-            hb_thread = threading.Thread(target=heartbeat, daemon=True)
-            hb_thread.start()
-            while True:
+            # Wake in time for the next heartbeat, however busy the clients are
+            if clients:
+                wait = max(0, HEARTBEAT_INTERVAL - (time.monotonic() - last_heartbeat))
+            else:
+                wait = HEARTBEAT_INTERVAL
+            for key, events in sel.select(timeout=wait):
+                if key.fileobj is server:
+                    conn, addr = server.accept()
+                    conn.setblocking(False)
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    enable_keepalive(conn)
+                    clients[conn] = b""
+                    outbox[conn] = b""
+                    controller.forget_written_regs()
+                    sel.register(conn, selectors.EVENT_READ)
+                    print("\n[CONNECTED] %s (%d client(s))" % (str(addr), len(clients)))
+                    continue
+
+                conn = key.fileobj
+                if conn not in clients:
+                    continue  # dropped earlier in this batch
                 try:
-                    data = conn.recv(1024).decode().strip()
-                    if not data:
-                        break
-
-                    # Handle multiple commands
-                    for line in data.split('\n'):
-                        line = line.strip()
-                        if not line:
+                    if events & selectors.EVENT_WRITE:
+                        flush_outbox(conn)
+                        if conn not in clients:
                             continue
 
-                        print("[RX] %s" % line)
-                        response = controller.process_command(line)
+                    if events & selectors.EVENT_READ:
+                        data = conn.recv(1024)
+                        if not data:
+                            drop_client(conn)
+                            continue
 
-                        if "?" in line:
-                            conn.send((response + "\n").encode())
-                            print("[TX] %s" % response)
+                        clients[conn], reply = handle_client_data(controller, clients[conn], data)
+                        if len(clients[conn]) > MAX_LINE_LEN:
+                            print("[ERROR] Line too long, dropping client")
+                            drop_client(conn, process_partial=False)
+                            continue
+                        if reply:
+                            outbox[conn] += reply
+                            flush_outbox(conn)
 
+                except (BlockingIOError, InterruptedError):
+                    pass
                 except ConnectionResetError:
-                    break
+                    if conn in clients:
+                        drop_client(conn)
                 except Exception as e:
                     print("[ERROR] %s" % str(e))
-                    break
+                    if conn in clients:
+                        drop_client(conn)
 
-            conn.close()
-            client_connected[0] = False
-            print("[DISCONNECTED]\n")
+            now = time.monotonic()
+            if clients and now - last_heartbeat >= HEARTBEAT_INTERVAL:
+                last_heartbeat = now
+                if fpga:
+                    current = fpga.read32(REG_CTRL)
+                    fpga.write32(REG_CTRL, current)
 
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
+        for conn in list(clients):
+            conn.close()
+        sel.close()
         server.close()
         if fpga:
             fpga.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("AM_RADIO_DEBUG") else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,  # same stream as the print() output
+    )
     run_server()
\ No newline at end of file
@@ -5,51 +5,79 @@ import socket
 import threading
 
 class MockFPGA:
+    # Responses are pre-encoded (newline included) and sent as-is
+    OK = b"OK\n"
+    IDN = b"MockFPGA,AM-Radio,v1.0\n"
+    STATUS = (  # indexed by broadcasting
+        b"BROADCAST:0,WATCHDOG:0,TEMP:42.5\n",
+        b"BROADCAST:1,WATCHDOG:0,TEMP:42.5\n",
+    )
+
     def __init__(self):
         self.channels = {i: {'enabled': False, 'freq': 540000} for i in range(1, 13)}
         self.broadcasting = False
         self.source = 'BRAM'
     
+        # Exact-match commands, keyed by the raw bytes off the wire
+        self._exact = {
+            b"*IDN?": self._idn,
+            b"STATUS?": self._status,
+            b"WATCHDOG:RESET": self._ok,
+            b"OUTPUT:STATE ON": self._output_on,
+            b"OUTPUT:STATE OFF": self._output_off,
+        }
+
+    def _ok(self):
+        return self.OK
+
+    def _idn(self):
+        return self.IDN
+
+    def _status(self):
+        return self.STATUS[self.broadcasting]
+
+    def _output_on(self):
+        self.broadcasting = True
+        print("  *** BROADCAST STARTED ***")
+        return self.OK
+
+    def _output_off(self):
+        self.broadcasting = False
+        print("  *** BROADCAST STOPPED ***")
+        return self.OK
+
     def handle_command(self, cmd):
-        cmd = cmd.strip().upper()
-        print(f"  RX: {cmd}")
-        
-        if cmd == "*IDN?":
-            return "MockFPGA,AM-Radio,v1.0"
-        if cmd == "STATUS?":
-            return f"BROADCAST:{'1' if self.broadcasting else '0'},WATCHDOG:0,TEMP:42.5"
-        if cmd == "WATCHDOG:RESET":
-            return "OK"
-        if cmd == "OUTPUT:STATE ON":
-            self.broadcasting = True
-            print("  *** BROADCAST STARTED ***")
-            return "OK"
-        if cmd == "OUTPUT:STATE OFF":
-            self.broadcasting = False
-            print("  *** BROADCAST STOPPED ***")
-            return "OK"
-        if cmd.startswith("FREQ:CH"):
-            return "OK"
-        if cmd.startswith("OUTPUT:CH"):
-            return "OK"
-        if cmd.startswith("SOURCE:MODE"):
-            return "OK"
-        return "OK"
+        cmd = cmd.strip()
+        print(f"  RX: {cmd.decode(errors='replace')}")
+
+        # GUI sends upper case; only fold case on a miss
+        handler = self._exact.get(cmd) or self._exact.get(cmd.upper())
+        if handler:
+            return handler()
+        return self.OK
 
 def handle_client(conn, addr, fpga):
     print(f"[+] Connected: {addr}")
-    buffer = ""
+    buffer = b""
+    rx_buf = bytearray(1024)  # one receive buffer per connection
+    rx_view = memoryview(rx_buf)
     try:
         while True:
-            data = conn.recv(1024)
-            if not data:
+            n = conn.recv_into(rx_view)
+            if not n:
                 break
-            buffer += data.decode()
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
+            buffer += rx_view[:n]
+            responses = []
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
                 if line.strip():
                     response = fpga.handle_command(line)
-                    conn.sendall(f"{response}\n".encode())
+                    # Like the real server, only queries get a reply line
+                    if b'?' in line:
+                        responses.append(response)
+            # One send per received batch
+            if responses:
+                conn.sendall(b"".join(responses))
     except:
         pass
     print(f"[-] Disconnected: {addr}")
@@ -70,6 +98,7 @@ def main():
     
     while True:
         conn, addr = server.accept()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         t = threading.Thread(target=handle_client, args=(conn, addr, fpga))
         t.daemon = True
         t.start()
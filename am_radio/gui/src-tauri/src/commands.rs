@@ -120,9 +120,7 @@ pub async fn update_channel(
     let device_state = manager.get_state().await;
 
     let current = device_state
-        .channels
-        .iter()
-        .find(|c| c.id == channel_id)
+        .channel(channel_id)
         .ok_or_else(|| format!("Channel {} not found", channel_id))?;
 
     let enabled = update.enabled.unwrap_or(current.enabled);
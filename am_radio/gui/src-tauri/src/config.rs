@@ -32,6 +32,9 @@ impl Config {
 
     // AUDIT LOG
     pub const MAX_LOG_ENTRIES: usize = 100;
+    pub const CONSOLE_QUEUE_SIZE: usize = 1024;  // Pending console lines before dropping
+    pub const AUDIT_LOG_CONSOLE: bool = cfg!(debug_assertions);  // Echo entries to stdout (dev builds only)
+    pub const AUDIT_LOG_MIN_LEVEL: &'static str = "INFO";  // DEBUG, INFO, WARNING or ERROR
 }
 
 /// SCPI Commands - matches FPGA firmware protocol
@@ -48,12 +51,28 @@ impl ScpiCommands {
     pub const WATCHDOG_STATUS: &'static str = "WATCHDOG:STATUS?";
     pub const WATCHDOG_TIMEOUT: &'static str = "WATCHDOG:TIMEOUT";  // Set timeout
 
+    // POLL LOOP (pre-terminated wire bytes, sent every poll)
+    pub const WATCHDOG_RESET_LINE: &'static [u8] = b"WATCHDOG:RESET\n";
+    pub const STATUS_LINE: &'static [u8] = b"STATUS?\n";
+
     // OUTPUT CONTROL
     pub const OUTPUT_ON: &'static str = "OUTPUT:STATE ON";
     pub const OUTPUT_OFF: &'static str = "OUTPUT:STATE OFF";
     pub const OUTPUT_STATUS: &'static str = "OUTPUT:STATE?";
     pub const OUTPUT_CH_PREFIX: &'static str = "CH";  // OUTPUT:CH1 ON
 
+    // PER-CHANNEL OUTPUT (indexed by channel - 1)
+    pub const CH_OUTPUT_ON: [&'static str; 12] = [
+        "CH1:OUTPUT ON", "CH2:OUTPUT ON", "CH3:OUTPUT ON", "CH4:OUTPUT ON",
+        "CH5:OUTPUT ON", "CH6:OUTPUT ON", "CH7:OUTPUT ON", "CH8:OUTPUT ON",
+        "CH9:OUTPUT ON", "CH10:OUTPUT ON", "CH11:OUTPUT ON", "CH12:OUTPUT ON",
+    ];
+    pub const CH_OUTPUT_OFF: [&'static str; 12] = [
+        "CH1:OUTPUT OFF", "CH2:OUTPUT OFF", "CH3:OUTPUT OFF", "CH4:OUTPUT OFF",
+        "CH5:OUTPUT OFF", "CH6:OUTPUT OFF", "CH7:OUTPUT OFF", "CH8:OUTPUT OFF",
+        "CH9:OUTPUT OFF", "CH10:OUTPUT OFF", "CH11:OUTPUT OFF", "CH12:OUTPUT OFF",
+    ];
+
     // FREQUENCY CONTROL
     pub const FREQ_PREFIX: &'static str = "CH";  // FREQ:CH1 540000
     pub const FREQ_QUERY_PREFIX: &'static str = "FREQ:CH";  // FREQ:CH1?
@@ -78,6 +97,12 @@ impl ScpiCommands {
     pub const TEMP_QUERY: &'static str = "SYSTEM:TEMP?";
     pub const UPTIME_QUERY: &'static str = "SYSTEM:UPTIME?";
     pub const ERROR_QUERY: &'static str = "SYSTEM:ERROR?";
+
+    /// Output on/off command for channel 1-12 (no formatting at call time); None for any other channel
+    pub fn channel_output(ch: u8, enabled: bool) -> Option<&'static str> {
+        let table = if enabled { &Self::CH_OUTPUT_ON } else { &Self::CH_OUTPUT_OFF };
+        (ch as usize).checked_sub(1).and_then(|idx| table.get(idx)).copied()
+    }
 }
 
 /// Frequency presets for quick channel setup
@@ -223,6 +248,22 @@ mod additional_tests {
             "Polling slower than watchdog timeout!");
     }
 
+    #[test]
+    fn test_channel_output_commands() {
+        for ch in 1..=12u8 {
+            assert_eq!(ScpiCommands::channel_output(ch, true), Some(format!("CH{}:OUTPUT ON", ch).as_str()));
+            assert_eq!(ScpiCommands::channel_output(ch, false), Some(format!("CH{}:OUTPUT OFF", ch).as_str()));
+        }
+        assert_eq!(ScpiCommands::channel_output(0, true), None);
+        assert_eq!(ScpiCommands::channel_output(13, false), None);
+    }
+
+    #[test]
+    fn test_poll_lines_match_commands() {
+        assert_eq!(ScpiCommands::WATCHDOG_RESET_LINE, format!("{}\n", ScpiCommands::WATCHDOG_RESET).as_bytes());
+        assert_eq!(ScpiCommands::STATUS_LINE, format!("{}\n", ScpiCommands::STATUS).as_bytes());
+    }
+
     #[test]
     fn test_reconnect_config_sane() {
         assert!(Config::MAX_RECONNECT_ATTEMPTS > 0);
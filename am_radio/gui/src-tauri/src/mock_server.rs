@@ -9,6 +9,9 @@ use std::net::{TcpListener, TcpStream};
 fn handle_client(mut stream: TcpStream) {
     let addr = stream.peer_addr().unwrap();
     println!("[CONNECTED] {}", addr);
+
+    // Replies are tiny - don't let Nagle hold them back
+    let _ = stream.set_nodelay(true);
     println!("{}", "-".repeat(50));
 
     let reader = BufReader::new(stream.try_clone().unwrap());
@@ -54,40 +57,35 @@ fn handle_client(mut stream: TcpStream) {
                     println!("[TX] STATUS (truncated)");
                 } else if data == "WATCHDOG:RESET" {
                     println!("     -> Watchdog reset");
-                } else if data.starts_with("SOURCE:INPUT ") {
-                    source = data.replace("SOURCE:INPUT ", "");
+                } else if let Some(value) = data.strip_prefix("SOURCE:INPUT ") {
+                    source.clear();
+                    source.push_str(value);
                     println!("     -> Audio source set to: {}", source);
-                } else if data.starts_with("SOURCE:MSG ") {
-                    let msg = data.replace("SOURCE:MSG ", "");
+                } else if let Some(msg) = data.strip_prefix("SOURCE:MSG ") {
                     println!("     -> Message selected: #{}", msg);
-                } else if data.starts_with("FREQ:CH") {
+                } else if let Some(rest) = data.strip_prefix("FREQ:CH") {
                     // Parse FREQ:CH1 540000
-                    let parts: Vec<&str> = data.split_whitespace().collect();
-                    if parts.len() >= 2 {
-                        let ch_str = parts[0].replace("FREQ:CH", "");
-                        if let (Ok(ch), Ok(freq)) = (ch_str.parse::<usize>(), parts[1].parse::<u32>()) {
+                    if let Some((ch_str, freq_str)) = rest.split_once(' ') {
+                        if let (Ok(ch), Ok(freq)) = (ch_str.parse::<usize>(), freq_str.trim().parse::<u32>()) {
                             if (1..=12).contains(&ch) {
                                 channels_freq[ch - 1] = freq;
                                 println!("     -> CH{} frequency: {} Hz ({:.0} kHz)", ch, freq, freq as f64 / 1000.0);
                             }
                         }
                     }
-                } else if data.starts_with("CH") && data.contains(":OUTPUT ") {
+                } else if let Some((ch_str, state)) = data
+                    .strip_prefix("CH")
+                    .and_then(|rest| rest.split_once(":OUTPUT "))
+                {
                     // Parse CH1:OUTPUT ON
-                    let data = data.replace(":", " ");
-                    let parts: Vec<&str> = data.split_whitespace().collect();
-                    if parts.len() >= 3 {
-                        let ch_str = parts[0].replace("CH", "");
-                        if let Ok(ch) = ch_str.parse::<usize>() {
-                            if (1..=12).contains(&ch) {
-                                let enabled = parts[2] == "ON";
-                                channels_enabled[ch - 1] = enabled;
-                                println!("     -> CH{} output: {}", ch, if enabled { "ON" } else { "OFF" });
-                            }
+                    if let Ok(ch) = ch_str.parse::<usize>() {
+                        if (1..=12).contains(&ch) {
+                            let enabled = state.trim() == "ON";
+                            channels_enabled[ch - 1] = enabled;
+                            println!("     -> CH{} output: {}", ch, if enabled { "ON" } else { "OFF" });
                         }
                     }
-                } else if data.starts_with("OUTPUT:STATE ") {
-                    let state = data.replace("OUTPUT:STATE ", "");
+                } else if let Some(state) = data.strip_prefix("OUTPUT:STATE ") {
                     broadcasting = state == "ON";
                     if broadcasting {
                         println!("     -> *** BROADCAST STARTED ***");
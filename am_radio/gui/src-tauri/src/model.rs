@@ -3,14 +3,21 @@
 // model.rs - FULL PRODUCTION VERSION
 // Complete NetworkManager with all features from Python
 use crate::state_machine::{BroadcastState, ConnectionState, WatchdogState, SourceMode};
+use std::collections::VecDeque;
 use std::sync::Arc;
-use tokio::io::AsyncReadExt;
+use std::fmt::Write as _;
+use std::io::Write;
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicU8, Ordering};
+use std::sync::mpsc;
 use std::time::Duration;
-use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader, BufWriter};
 use tokio::net::TcpStream;
+use tokio::net::tcp::{OwnedReadHalf, OwnedWriteHalf};
 use tokio::sync::{broadcast, RwLock};
 use tokio::time::{timeout, sleep, Instant};
 use serde::{Deserialize, Serialize};
+use parking_lot::Mutex;
+use chrono::TimeZone;
 use crate::retry::{RetryConfig, RetryResult, with_retry};
 
 use crate::config::{Config, ScpiCommands};
@@ -79,6 +86,18 @@ impl Default for DeviceState {
         }
     }
 }
+
+impl DeviceState {
+    /// Look up a channel by its 1-based id (channels are stored in id order)
+    pub fn channel(&self, id: u8) -> Option<&Channel> {
+        self.channels.get((id as usize).checked_sub(1)?)
+    }
+
+    /// Mutable variant of channel()
+    pub fn channel_mut(&mut self, id: u8) -> Option<&mut Channel> {
+        self.channels.get_mut((id as usize).checked_sub(1)?)
+    }
+}
 // AUDIT LOG ENTRY
 #[derive(Clone, Debug, Serialize)]
 pub struct AuditEntry {
@@ -87,10 +106,107 @@ pub struct AuditEntry {
     pub message: String,
 }
 
+// STATUS FLAG VALUES
+/// True for the "on" spellings a status flag can take ("1" / "ON")
+fn is_on(value: &str) -> bool {
+    matches!(value, "1" | "ON")
+}
+
+// AUDIT LOG
+/// Append to the audit ring buffer (short, never held across an await)
+fn push_audit_entry(log: &Mutex<VecDeque<AuditEntry>>, entry: AuditEntry) {
+    let mut log = log.lock();
+    log.push_back(entry);
+
+    // Keep only last 100 entries (same as Python)
+    if log.len() > Config::MAX_LOG_ENTRIES {
+        log.pop_front();
+    }
+}
+
+/// Severity order for audit levels (unknown levels rank as ERROR so they are never filtered)
+fn level_rank(level: &str) -> u8 {
+    match level {
+        "DEBUG" => 0,
+        "INFO" => 1,
+        "WARNING" => 2,
+        _ => 3,
+    }
+}
+
+/// True if entries at this level are recorded - check before building an expensive message
+fn log_enabled(level: &str) -> bool {
+    level_rank(level) >= level_rank(Config::AUDIT_LOG_MIN_LEVEL)
+}
+
+// UNSENT DATA
+/// After a failed write, drop whatever is still in the write buffer so it can't go out
+/// with the next, unrelated flush
+fn discard_unsent(writer: &mut Option<BufWriter<OwnedWriteHalf>>) {
+    if let Some(w) = writer.take() {
+        *writer = Some(BufWriter::new(w.into_inner()));
+    }
+}
+
+// CONSOLE WRITER
+/// Spawn the thread that owns stdout for audit lines, so log() never blocks on terminal I/O
+/// Lines arrive as (unix seconds, "LEVEL: message"); the timestamp is prefixed here
+/// `dropped` counts lines log() couldn't queue - reported here once the writer catches up
+fn spawn_console_writer(dropped: Arc<AtomicU64>) -> mpsc::SyncSender<(i64, String)> {
+    let (tx, rx) = mpsc::sync_channel::<(i64, String)>(Config::CONSOLE_QUEUE_SIZE);
+    std::thread::Builder::new()
+        .name("audit-console".to_string())
+        .spawn(move || {
+            let stdout = std::io::stdout();
+            let mut batch = String::new();
+
+            // %H:%M:%S only changes once a second - format it once per second
+            let mut stamp_secs = i64::MIN;
+            let mut stamp = String::new();
+            let mut push_line = |batch: &mut String, (secs, line): (i64, String)| {
+                if secs != stamp_secs {
+                    stamp_secs = secs;
+                    stamp = chrono::Local
+                        .timestamp_opt(secs, 0)
+                        .single()
+                        .map(|t| t.format("%H:%M:%S").to_string())
+                        .unwrap_or_default();
+                }
+                batch.push('[');
+                batch.push_str(&stamp);
+                batch.push_str("] ");
+                batch.push_str(&line);
+                batch.push('\n');
+            };
+
+            while let Ok(entry) = rx.recv() {
+                batch.clear();
+                let mut secs = entry.0;
+                push_line(&mut batch, entry);
+
+                // Drain whatever else is already queued so a burst goes out in one write
+                for entry in rx.try_iter() {
+                    secs = entry.0;
+                    push_line(&mut batch, entry);
+                }
+
+                // Report lines log() had to drop while we were behind
+                let lost = dropped.swap(0, Ordering::Relaxed);
+                if lost > 0 {
+                    push_line(&mut batch, (secs, format!("WARNING: {} console line(s) dropped", lost)));
+                }
+                let _ = stdout.lock().write_all(batch.as_bytes());
+            }
+        })
+        .expect("failed to spawn audit console thread");
+    tx
+}
+
 // NETWORK MANAGER - The main class
 pub struct NetworkManager {
-    // TCP connection (wrapped for async access)
-    stream: Arc<RwLock<Option<TcpStream>>>,
+    // TCP connection, split so plain writes never wait behind a pending read
+    writer: Arc<RwLock<Option<BufWriter<OwnedWriteHalf>>>>,
+    reader: Arc<RwLock<Option<BufReader<OwnedReadHalf>>>>,
     pending_changes: RwLock<Vec<ChannelChange>>,
 
     // Device state
@@ -99,63 +215,75 @@ pub struct NetworkManager {
     // Event bus for pub/sub
     event_tx: broadcast::Sender<EventType>,
 
-    // Audit log (thread-safe, max 100 entries)
-    audit_log: Arc<RwLock<Vec<AuditEntry>>>,
+    // Audit log (thread-safe ring buffer, max 100 entries; sync mutex - never held across an await)
+    audit_log: Arc<Mutex<VecDeque<AuditEntry>>>,
+
+    // Console output is handed to a writer thread; lines are dropped (counted, then reported by the writer) when it falls behind
+    console_tx: Option<mpsc::SyncSender<(i64, String)>>,  // None unless Config::AUDIT_LOG_CONSOLE
+    console_dropped: Arc<AtomicU64>,
 
     // Connection info
     current_ip: Arc<RwLock<Option<String>>>,
     current_port: Arc<RwLock<Option<u16>>>,
 
-    // Control flags
-    is_running: Arc<RwLock<bool>>,
-    reconnect_attempts: Arc<RwLock<u8>>,
+    // Control flags (atomics: read every poll, no lock needed)
+    is_running: Arc<AtomicBool>,
+    reconnect_attempts: Arc<AtomicU8>,
 
     // Watchdog tracking
     last_watchdog_reset: Arc<RwLock<Instant>>,
+
+    // Last raw STATUS? response (skip reparse when unchanged)
+    last_status_raw: Arc<RwLock<Option<String>>>,
 }
 
 impl NetworkManager {
     // CONSTRUCTOR
     pub fn new(event_tx: broadcast::Sender<EventType>) -> Self {
+        let console_dropped = Arc::new(AtomicU64::new(0));
         Self {
-            stream: Arc::new(RwLock::new(None)),
+            writer: Arc::new(RwLock::new(None)),
+            reader: Arc::new(RwLock::new(None)),
             state: Arc::new(RwLock::new(DeviceState::default())),
             event_tx,
-            audit_log: Arc::new(RwLock::new(Vec::new())),
+            audit_log: Arc::new(Mutex::new(VecDeque::with_capacity(Config::MAX_LOG_ENTRIES + 1))),
+            console_tx: Config::AUDIT_LOG_CONSOLE.then(|| spawn_console_writer(console_dropped.clone())),
+            console_dropped,
             current_ip: Arc::new(RwLock::new(None)),
             current_port: Arc::new(RwLock::new(None)),
-            is_running: Arc::new(RwLock::new(false)),
-            reconnect_attempts: Arc::new(RwLock::new(0)),
+            is_running: Arc::new(AtomicBool::new(false)),
+            reconnect_attempts: Arc::new(AtomicU8::new(0)),
             pending_changes: RwLock::new(Vec::new()),
             last_watchdog_reset: Arc::new(RwLock::new(Instant::now())),
+            last_status_raw: Arc::new(RwLock::new(None)),
         }
     }
 
     // AUDIT LOGGING (Same as Python)
     async fn log(&self, level: &str, message: &str) {
+        // Below the configured level - not recorded at all
+        if !log_enabled(level) {
+            return;
+        }
+
+        // One clock read serves both the entry and the console line
+        // (UTC - no timezone lookup; the console writer converts to local time)
+        let now = chrono::Utc::now().timestamp();
         let entry = AuditEntry {
-            timestamp: std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .unwrap()
-                .as_secs(),
+            timestamp: now as u64,
             level: level.to_string(),
             message: message.to_string(),
         };
 
-        let mut log = self.audit_log.write().await;
-        log.push(entry);
+        push_audit_entry(&self.audit_log, entry);
 
-        // Keep only last 100 entries (same as Python)
-        if log.len() > 100 {
-            log.remove(0);
+        // Also print to console (off this task - never wait on stdout)
+        if let Some(console_tx) = &self.console_tx {
+            let line = format!("{}: {}", level, message);
+            if console_tx.try_send((now, line)).is_err() {
+                self.console_dropped.fetch_add(1, Ordering::Relaxed);
+            }
         }
-
-        // Also print to console
-        println!("[{}] {}: {}",
-            chrono::Local::now().format("%H:%M:%S"),
-            level,
-            message
-        );
     }
 
     async fn log_info(&self, message: &str) {
@@ -174,7 +302,14 @@ impl NetworkManager {
     // CONNECT TO FPGA
     pub async fn connect(&self, ip: &str, port: u16) -> Result<(), String> {
         // Check if already connected
-        if *self.is_running.read().await {
+        if self.is_running.load(Ordering::SeqCst) {
+            // Same target, still healthy (the poll loop checks it every 500ms) - reuse it
+            let same_target = self.current_ip.read().await.as_deref() == Some(ip)
+                && *self.current_port.read().await == Some(port);
+            if same_target && self.state.read().await.connection == ConnectionState::Connected {
+                self.log_info(&format!("Already connected to {}:{}", ip, port)).await;
+                return Ok(());
+            }
             return Err("Already connected".to_string());
         }
 
@@ -222,8 +357,10 @@ impl NetworkManager {
             self.log_warning(&format!("Failed to set TCP_NODELAY: {}", e)).await;
         }
 
-        // Store the stream
-        *self.stream.write().await = Some(stream);
+        // Store the stream halves
+        let (read_half, write_half) = stream.into_split();
+        *self.reader.write().await = Some(BufReader::new(read_half));
+        *self.writer.write().await = Some(BufWriter::new(write_half));
 
         // Update state to Connected
         {
@@ -233,10 +370,10 @@ impl NetworkManager {
         }
 
         // Reset reconnect counter
-        *self.reconnect_attempts.write().await = 0;
+        self.reconnect_attempts.store(0, Ordering::SeqCst);
 
         // Set running flag
-        *self.is_running.write().await = true;
+        self.is_running.store(true, Ordering::SeqCst);
 
         // Emit success event
         let _ = self.event_tx.send(EventType::ConnectSuccess);
@@ -282,13 +419,14 @@ impl NetworkManager {
             if let Ok(response) = self.query(&format!("FREQ:CH{}?", ch)).await {
                 if let Ok(freq) = response.trim().parse::<u32>() {
                     let mut state = self.state.write().await;
-                    if let Some(channel) = state.channels.iter_mut().find(|c| c.id == ch) {
+                    if let Some(channel) = state.channel_mut(ch) {
                         channel.frequency = freq;
                     }
                 }
             }
         }
 
+        self.invalidate_status_cache().await;
         self.log_info("Device initialized").await;
         Ok(())
     }
@@ -298,7 +436,7 @@ impl NetworkManager {
         self.log_info("Disconnecting...").await;
 
         // Stop polling
-        *self.is_running.write().await = false;
+        self.is_running.store(false, Ordering::SeqCst);
         self.pending_changes.write().await.clear();
 
         // If broadcasting, stop first
@@ -310,12 +448,12 @@ impl NetworkManager {
             }
         }
 
-        // Close TCP stream
+        // Close TCP stream (dropping both halves closes the connection)
         {
-            let mut stream = self.stream.write().await;
-            if let Some(s) = stream.take() {
-                drop(s);  // Close connection
-            }
+            let mut reader = self.reader.write().await;
+            let mut writer = self.writer.write().await;
+            drop(reader.take());
+            drop(writer.take());
         }
 
         // Update state
@@ -338,26 +476,64 @@ impl NetworkManager {
         Ok(())
     }
 
+    // INVALIDATE STATUS CACHE - call after changing local state, so the next poll
+    // re-parses STATUS? and corrects anything the device rejected or never applied
+    async fn invalidate_status_cache(&self) {
+        *self.last_status_raw.write().await = None;
+    }
+
     // SEND COMMAND (Low-level)
     async fn send_command(&self, command: &str) -> Result<(), String> {
-        let mut stream_guard = self.stream.write().await;
+        let mut writer_guard = self.writer.write().await;
+
+        if let Some(writer) = writer_guard.as_mut() {
+            match timeout(
+                Duration::from_secs(Config::COMMAND_TIMEOUT_SECS),
+                async {
+                    // Both parts land in the write buffer - no per-command String
+                    writer.write_all(command.as_bytes()).await?;
+                    writer.write_all(b"\n").await?;
+                    // Flush to ensure it's sent
+                    writer.flush().await
+                }
+            ).await {
+                Ok(Ok(_)) => Ok(()),
+                Ok(Err(e)) => {
+                    discard_unsent(&mut writer_guard);
+                    Err(format!("Write failed: {}", e))
+                }
+                Err(_) => {
+                    discard_unsent(&mut writer_guard);
+                    Err("Command timeout".to_string())
+                }
+            }
+        } else {
+            Err("Not connected".to_string())
+        }
+    }
 
-        if let Some(stream) = stream_guard.as_mut() {
-            let msg = format!("{}\n", command);
+    // SEND BATCH - several newline-terminated commands in one write. The writer lock
+    // is held throughout, so nothing (polls included) can interleave with the batch
+    async fn send_batch(&self, batch: &str) -> Result<(), String> {
+        let mut writer_guard = self.writer.write().await;
 
+        if let Some(writer) = writer_guard.as_mut() {
             match timeout(
                 Duration::from_secs(Config::COMMAND_TIMEOUT_SECS),
-                stream.write_all(msg.as_bytes())
+                async {
+                    writer.write_all(batch.as_bytes()).await?;
+                    writer.flush().await
+                }
             ).await {
-                Ok(Ok(_)) => {
-                    // Flush to ensure it's sent
-                    if let Err(e) = stream.flush().await {
-                        return Err(format!("Flush failed: {}", e));
-                    }
-                    Ok(())
+                Ok(Ok(_)) => Ok(()),
+                Ok(Err(e)) => {
+                    discard_unsent(&mut writer_guard);
+                    Err(format!("Write failed: {}", e))
+                }
+                Err(_) => {
+                    discard_unsent(&mut writer_guard);
+                    Err("Command timeout".to_string())
                 }
-                Ok(Err(e)) => Err(format!("Write failed: {}", e)),
-                Err(_) => Err("Command timeout".to_string()),
             }
         } else {
             Err("Not connected".to_string())
@@ -366,14 +542,15 @@ impl NetworkManager {
 
     // QUERY (Send command, get response)
     async fn query(&self, command: &str) -> Result<String, String> {
+        // Hold the read half for the whole exchange so concurrent queries
+        // can't consume each other's responses (plain writes still proceed)
+        let mut reader_guard = self.reader.write().await;
+
         // Send the command
         self.send_command(command).await?;
 
         // Read response
-        let mut stream_guard = self.stream.write().await;
-
-        if let Some(stream) = stream_guard.as_mut() {
-            let mut reader = BufReader::new(stream);
+        if let Some(reader) = reader_guard.as_mut() {
             let mut response = String::new();
 
             match timeout(
@@ -392,11 +569,13 @@ impl NetworkManager {
 
     // POLLING TASK - Runs every 500ms in background
     fn spawn_poll_task(&self) {
-        let stream = self.stream.clone();
+        let writer = self.writer.clone();
+        let reader = self.reader.clone();
         let state = self.state.clone();
         let event_tx = self.event_tx.clone();
         let is_running = self.is_running.clone();
         let last_watchdog_reset = self.last_watchdog_reset.clone();
+        let last_status_raw = self.last_status_raw.clone();
         let audit_log = self.audit_log.clone();
         let current_ip = self.current_ip.clone();
         let current_port = self.current_port.clone();
@@ -404,10 +583,12 @@ impl NetworkManager {
 
         tokio::spawn(async move {
             let mut consecutive_errors = 0u8;
+            // STATUS? response buffer, reused across polls
+            let mut response = String::with_capacity(128);
 
             loop {
                 // Check if we should stop
-                if !*is_running.read().await {
+                if !is_running.load(Ordering::SeqCst) {
                     break;
                 }
 
@@ -415,17 +596,19 @@ impl NetworkManager {
                 sleep(Duration::from_millis(Config::POLL_INTERVAL_MS)).await;
 
                 // Check if we should stop (again, after sleep)
-                if !*is_running.read().await {
+                if !is_running.load(Ordering::SeqCst) {
                     break;
                 }
 
                 // CRITICAL: WATCHDOG RESET
                 // Must send this every poll or FPGA stops output!
                 let watchdog_result = {
-                    let mut stream_guard = stream.write().await;
-                    if let Some(s) = stream_guard.as_mut() {
-                        let msg = format!("{}\n", ScpiCommands::WATCHDOG_RESET);
-                        s.write_all(msg.as_bytes()).await
+                    let mut writer_guard = writer.write().await;
+                    if let Some(w) = writer_guard.as_mut() {
+                        match w.write_all(ScpiCommands::WATCHDOG_RESET_LINE).await {
+                            Ok(_) => w.flush().await,
+                            Err(e) => Err(e),
+                        }
                     } else {
                         Err(std::io::Error::new(std::io::ErrorKind::NotConnected, "No stream"))
                     }
@@ -443,15 +626,40 @@ impl NetworkManager {
                         level: "ERROR".to_string(),
                         message: format!("Watchdog reset failed: {}", e),
                     };
-                    audit_log.write().await.push(entry);
+                    push_audit_entry(&audit_log, entry);
 
                     // Too many errors - connection lost
                     if consecutive_errors >= Config::MAX_CONSECUTIVE_ERRORS {
-                        Self::handle_connection_lost(
+                        match Self::handle_connection_lost(
                             &state, &event_tx, &is_running, &current_ip,
                             &current_port, &reconnect_attempts
-                        ).await;
-                        break;
+                        ).await {
+                            Some(stream) => {
+                                // Re-check with both halves locked (same order as disconnect()).
+                                // disconnect() clears is_running before it takes these locks, so
+                                // either we see it here or its teardown runs after us and closes
+                                // the new halves - never a live socket without a poll task
+                                let mut reader_guard = reader.write().await;
+                                let mut writer_guard = writer.write().await;
+                                if !is_running.load(Ordering::SeqCst) {
+                                    drop(stream);
+                                    drop(writer_guard);
+                                    drop(reader_guard);
+                                    state.write().await.connection = ConnectionState::Disconnected;
+                                    break;
+                                }
+
+                                // Keep polling on the new connection
+                                let (read_half, write_half) = stream.into_split();
+                                *reader_guard = Some(BufReader::new(read_half));
+                                *writer_guard = Some(BufWriter::new(write_half));
+                                drop(writer_guard);
+                                drop(reader_guard);
+                                *last_status_raw.write().await = None;
+                                consecutive_errors = 0;
+                            }
+                            None => break,
+                        }
                     }
                     continue;
                 }
@@ -461,48 +669,71 @@ impl NetworkManager {
                 consecutive_errors = 0;
 
                 // QUERY STATUS
-                let status_result = {
-                    let mut stream_guard = stream.write().await;
-                    if let Some(s) = stream_guard.as_mut() {
-                        // Send query
-                        let msg = format!("{}\n", ScpiCommands::STATUS);
-                        if s.write_all(msg.as_bytes()).await.is_ok() {
-                            // Read response
-                            let mut buf = [0u8; 1024];
-                            match timeout(Duration::from_secs(2), s.read(&mut buf)).await {
-                                Ok(Ok(n)) if n > 0 => {
-                                    Some(String::from_utf8_lossy(&buf[..n]).to_string())
-                                }
-                                _ => None
+                let got_status = {
+                    // Reader first, then writer - same order as query()
+                    let mut reader_guard = reader.write().await;
+
+                    // Send query
+                    let sent = {
+                        let mut writer_guard = writer.write().await;
+                        match writer_guard.as_mut() {
+                            Some(w) => {
+                                w.write_all(ScpiCommands::STATUS_LINE).await.is_ok()
+                                    && w.flush().await.is_ok()
                             }
-                        } else {
-                            None
+                            None => false,
                         }
-                    } else {
-                        None
+                    };
+
+                    // Read response
+                    response.clear();
+                    match reader_guard.as_mut() {
+                        Some(r) if sent => {
+                            matches!(
+                                timeout(Duration::from_secs(2), r.read_line(&mut response)).await,
+                                Ok(Ok(n)) if n > 0
+                            )
+                        }
+                        _ => false
                     }
                 };
 
-                // Parse status response
-                if let Some(response) = status_result {
-                    Self::parse_status_static(&response, &state, &event_tx).await;
+                // Parse status response (skip if identical to last poll)
+                if got_status {
+                    let mut last = last_status_raw.write().await;
+                    if last.as_deref() == Some(response.as_str()) {
+                        state.write().await.last_status_time = Some(
+                            std::time::SystemTime::now()
+                                .duration_since(std::time::UNIX_EPOCH)
+                                .unwrap()
+                                .as_secs()
+                        );
+                    } else {
+                        Self::parse_status_static(&response, &state, &event_tx).await;
+                        match last.as_mut() {
+                            Some(prev) => prev.clone_from(&response),
+                            None => *last = Some(response.clone()),
+                        }
+                    }
                 }
 
-                // Emit state update event
-                let _ = event_tx.send(EventType::DeviceStateUpdated);
+                // Emit state update event (every poll - skip if nobody listens)
+                if event_tx.receiver_count() > 0 {
+                    let _ = event_tx.send(EventType::DeviceStateUpdated);
+                }
             }
         });
     }
 
-    // HANDLE CONNECTION LOST - Attempt reconnection
+    // HANDLE CONNECTION LOST - Attempt reconnection, returns the new stream on success
     async fn handle_connection_lost(
         state: &Arc<RwLock<DeviceState>>,
         event_tx: &broadcast::Sender<EventType>,
-        is_running: &Arc<RwLock<bool>>,
+        is_running: &Arc<AtomicBool>,
         current_ip: &Arc<RwLock<Option<String>>>,
         current_port: &Arc<RwLock<Option<u16>>>,
-        reconnect_attempts: &Arc<RwLock<u8>>,
-    ) {
+        reconnect_attempts: &Arc<AtomicU8>,
+    ) -> Option<TcpStream> {
         // Update state
         {
             let mut s = state.write().await;
@@ -519,10 +750,10 @@ impl NetworkManager {
 
         if ip.is_none() || port.is_none() {
             // No connection info - can't reconnect
-            *is_running.write().await = false;
+            is_running.store(false, Ordering::SeqCst);
             state.write().await.connection = ConnectionState::Disconnected;
             let _ = event_tx.send(EventType::ConnectionStateChanged(ConnectionState::Disconnected));
-            return;
+            return None;
         }
 
         let ip = ip.unwrap();
@@ -530,7 +761,14 @@ impl NetworkManager {
 
         // Attempt reconnection
         for attempt in 1..=Config::MAX_RECONNECT_ATTEMPTS {
-            *reconnect_attempts.write().await = attempt;
+            // User disconnected while we waited - stop trying
+            if !is_running.load(Ordering::SeqCst) {
+                reconnect_attempts.store(0, Ordering::SeqCst);
+                state.write().await.connection = ConnectionState::Disconnected;
+                return None;
+            }
+
+            reconnect_attempts.store(attempt, Ordering::SeqCst);
 
             let _ = event_tx.send(EventType::ReconnectAttempt(attempt));
 
@@ -546,23 +784,31 @@ impl NetworkManager {
                 Duration::from_secs(Config::CONNECTION_TIMEOUT_SECS),
                 TcpStream::connect(&addr)
             ).await {
-                Ok(Ok(_stream)) => {
-                    // Success!
-                    println!("[RECONNECT] Success!");
-
-                    // Note: In real code, we'd need to update the stream reference
-                    // This is simplified - real impl would need Arc<RwLock<Option<TcpStream>>>
+                Ok(Ok(stream)) => {
+                    let _ = stream.set_nodelay(true);
 
+                    // Checked under the state lock so Connected can't overwrite disconnect()'s
+                    // Disconnected (it clears is_running first). This doesn't cover the stream
+                    // halves - the poll loop re-checks under the reader/writer locks to install them
                     let mut s = state.write().await;
+                    if !is_running.load(Ordering::SeqCst) {
+                        println!("[RECONNECT] Disconnected meanwhile, dropping new connection");
+                        s.connection = ConnectionState::Disconnected;
+                        reconnect_attempts.store(0, Ordering::SeqCst);
+                        return None;
+                    }
+
+                    // Success!
+                    println!("[RECONNECT] Success!");
                     s.connection = ConnectionState::Connected;
                     s.error_count = 0;
 
-                    *reconnect_attempts.write().await = 0;
+                    reconnect_attempts.store(0, Ordering::SeqCst);
 
                     let _ = event_tx.send(EventType::ReconnectSuccess);
                     let _ = event_tx.send(EventType::ConnectionStateChanged(ConnectionState::Connected));
 
-                    return;
+                    return Some(stream);
                 }
                 _ => {
                     println!("[RECONNECT] Attempt {} failed", attempt);
@@ -573,11 +819,12 @@ impl NetworkManager {
         // All attempts failed
         println!("[RECONNECT] All attempts failed, giving up");
 
-        *is_running.write().await = false;
+        is_running.store(false, Ordering::SeqCst);
         state.write().await.connection = ConnectionState::Disconnected;
 
         let _ = event_tx.send(EventType::ReconnectFailed);
         let _ = event_tx.send(EventType::ConnectionStateChanged(ConnectionState::Disconnected));
+        None
     }
 
     // PARSE STATUS RESPONSE
@@ -605,7 +852,7 @@ impl NetworkManager {
             match key {
                 "BROADCAST" | "OUTPUT" => {
                     let was_broadcasting = s.broadcast == BroadcastState::Broadcasting;
-                    s.broadcast = if value == "1" || value == "ON" {
+                    s.broadcast = if is_on(value) {
                         BroadcastState::Broadcasting
                     } else {
                         BroadcastState::Idle
@@ -623,12 +870,7 @@ impl NetworkManager {
                 }
                 "WATCHDOG" => {
                     let old_state = s.watchdog;
-                    s.watchdog = match value {
-                        "0" | "OK" => WatchdogState::Ok,
-                        "1" | "WARNING" => WatchdogState::Warning,
-                        "2" | "TRIGGERED" | "FAIL" => WatchdogState::Triggered,
-                        _ => WatchdogState::Ok,
-                    };
+                    s.watchdog = WatchdogState::from_status(value);
 
                     // Emit event if watchdog triggered
                     if s.watchdog == WatchdogState::Triggered && old_state != WatchdogState::Triggered {
@@ -647,18 +889,14 @@ impl NetworkManager {
                     }
                 }
                 "SOURCE" => {
-                    s.source = if value == "ADC" {
-                        SourceMode::Adc
-                    } else {
-                        SourceMode::Bram
-                    };
+                    s.source = SourceMode::from_str(value);
                 }
                 _ => {
                     // Check for channel status: "CH1", "CH2", etc.
                     if let Some(stripped) = key.strip_prefix("CH") {
                         if let Ok(ch_num) = stripped.parse::<u8>() {
-                            if let Some(channel) = s.channels.iter_mut().find(|c| c.id == ch_num) {
-                                channel.enabled = value == "1" || value == "ON";
+                            if let Some(channel) = s.channel_mut(ch_num) {
+                                channel.enabled = is_on(value);
                             }
                         }
                     }
@@ -704,6 +942,7 @@ impl NetworkManager {
             let mut state = self.state.write().await;
             state.broadcast = BroadcastState::Broadcasting;
         }
+        self.invalidate_status_cache().await;
 
         // Emit event
         let _ = self.event_tx.send(EventType::BroadcastStarted);
@@ -727,6 +966,7 @@ impl NetworkManager {
             let mut state = self.state.write().await;
             state.broadcast = BroadcastState::Idle;
         }
+        self.invalidate_status_cache().await;
 
         // Emit event
         let _ = self.event_tx.send(EventType::BroadcastStopped);
@@ -737,6 +977,17 @@ impl NetworkManager {
 
     // SET CHANNEL
     pub async fn set_channel(&self, ch: u8, freq: u32, enabled: bool) -> Result<(), String> {
+        // FREQ + OUTPUT go out in the same write
+        let mut batch = String::with_capacity(48);
+        Self::push_channel_commands(&mut batch, ch, freq, enabled)?;
+        self.send_batch(&batch).await?;
+
+        self.record_channel(ch, freq, enabled).await;
+        Ok(())
+    }
+
+    // PUSH CHANNEL COMMANDS (validated, appended to a batch - caller sends it)
+    fn push_channel_commands(batch: &mut String, ch: u8, freq: u32, enabled: bool) -> Result<(), String> {
         if !(1..=12).contains(&ch) {
             return Err(format!("Invalid channel: {}", ch));
         }
@@ -746,28 +997,42 @@ impl NetworkManager {
                 freq, Config::MIN_FREQUENCY, Config::MAX_FREQUENCY));
         }
 
-        // Set frequency
-        let freq_cmd = format!("CH{}:FREQ {}", ch, freq);
-        self.send_command(&freq_cmd).await?;
+        let output_cmd = ScpiCommands::channel_output(ch, enabled)
+            .ok_or_else(|| format!("Invalid channel: {}", ch))?;
 
-        // Set enabled state
-        let state_cmd = format!("CH{}:OUTPUT {}", ch, if enabled { "ON" } else { "OFF" });
-        self.send_command(&state_cmd).await?;
+        // Set frequency, then enabled state
+        let _ = writeln!(batch, "CH{}:FREQ {}", ch, freq);
+        batch.push_str(output_cmd);
+        batch.push('\n');
+        Ok(())
+    }
 
-        // Update local state
-        {
+    // RECORD CHANNEL (local state, event and audit entry once the commands are sent)
+    async fn record_channel(&self, ch: u8, freq: u32, enabled: bool) {
+        // Update local state (commands always go out - the device is the source of truth)
+        let changed = {
             let mut state = self.state.write().await;
-            if let Some(channel) = state.channels.iter_mut().find(|c| c.id == ch) {
-                channel.frequency = freq;
-                channel.enabled = enabled;
+            match state.channel_mut(ch) {
+                Some(channel) if channel.frequency != freq || channel.enabled != enabled => {
+                    channel.frequency = freq;
+                    channel.enabled = enabled;
+                    true
+                }
+                _ => false,
             }
-        }
+        };
+        self.invalidate_status_cache().await;
 
-        // Emit event
-        let _ = self.event_tx.send(EventType::ChannelUpdated(ch));
+        // Emit event (only when something actually changed)
+        if changed {
+            let _ = self.event_tx.send(EventType::ChannelUpdated(ch));
+        }
 
-        self.log_info(&format!("CH{} set to {} Hz, enabled={}", ch, freq, enabled)).await;
-        Ok(())
+        // Re-asserting the current settings (e.g. enable_preset) is routine - keep it out of the audit trail
+        let level = if changed { "INFO" } else { "DEBUG" };
+        if log_enabled(level) {
+            self.log(level, &format!("CH{} set to {} Hz, enabled={}", ch, freq, enabled)).await;
+        }
     }
 
     // SET SOURCE MODE
@@ -783,10 +1048,13 @@ impl NetworkManager {
         self.send_command(&cmd).await?;
 
         // Update local state
-        self.state.write().await.source = source;
+        let previous = std::mem::replace(&mut self.state.write().await.source, source);
+        self.invalidate_status_cache().await;
 
-        // Emit event
-        let _ = self.event_tx.send(EventType::SourceChanged(source));
+        // Emit event (only when something actually changed)
+        if previous != source {
+            let _ = self.event_tx.send(EventType::SourceChanged(source));
+        }
 
         Ok(())
     }
@@ -811,15 +1079,21 @@ impl NetworkManager {
             _ => vec![1],
         };
 
-        // Disable all channels first
-        for ch in 1..=12u8 {
-            self.set_channel(ch, freqs[(ch - 1) as usize], false).await?;
+        // Disable all channels first, then enable selected channels
+        let steps: Vec<(u8, u32, bool)> = (1..=12u8)
+            .map(|ch| (ch, freqs[(ch - 1) as usize], false))
+            .chain(channels.iter().map(|&ch| (ch, freqs[(ch - 1) as usize], true)))
+            .collect();
+
+        // Whole preset is validated up front and goes out in one write
+        let mut batch = String::with_capacity(steps.len() * 40);
+        for &(ch, freq, enabled) in &steps {
+            Self::push_channel_commands(&mut batch, ch, freq, enabled)?;
         }
+        self.send_batch(&batch).await?;
 
-        // Enable selected channels
-        for &ch in &channels {
-            let freq = freqs[(ch - 1) as usize];
-            self.set_channel(ch, freq, true).await?;
+        for &(ch, freq, enabled) in &steps {
+            self.record_channel(ch, freq, enabled).await;
         }
 
         self.log_info(&format!("Enabled {} channel preset", count)).await;
@@ -833,7 +1107,7 @@ impl NetworkManager {
 
         // GET AUDIT LOG
         pub async fn get_audit_log(&self) -> Vec<AuditEntry> {
-            self.audit_log.read().await.clone()
+            self.audit_log.lock().iter().cloned().collect()
         }
 
         // IS CONNECTED
@@ -862,6 +1136,7 @@ impl NetworkManager {
             let mut state = self.state.write().await;
             state.broadcast = BroadcastState::Broadcasting;
         }
+        self.invalidate_status_cache().await;
 
         let _ = self.event_tx.send(EventType::BroadcastStarted);
         Ok(())
@@ -875,3 +1150,109 @@ impl NetworkManager {
 }
 
 
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::AtomicUsize;
+    use tokio::net::TcpListener;
+
+    // Minimal device: answers every query with OK, counts open connections and
+    // STATUS? polls after a reconnect. The first connection is dropped on its
+    // first watchdog reset to simulate losing the link.
+    async fn spawn_flaky_device() -> (u16, Arc<AtomicUsize>, Arc<AtomicUsize>) {
+        let listener = TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let port = listener.local_addr().unwrap().port();
+        let open = Arc::new(AtomicUsize::new(0));
+        let polls_after_reconnect = Arc::new(AtomicUsize::new(0));
+
+        let (open_c, polls_c) = (open.clone(), polls_after_reconnect.clone());
+        tokio::spawn(async move {
+            for index in 0.. {
+                let (stream, _) = listener.accept().await.unwrap();
+                let (open, polls) = (open_c.clone(), polls_c.clone());
+                open.fetch_add(1, Ordering::SeqCst);
+                tokio::spawn(async move {
+                    let (read_half, mut write_half) = stream.into_split();
+                    let mut lines = BufReader::new(read_half).lines();
+                    while let Ok(Some(line)) = lines.next_line().await {
+                        if index == 0 && line == ScpiCommands::WATCHDOG_RESET {
+                            break;
+                        }
+                        if index > 0 && line == ScpiCommands::STATUS {
+                            polls.fetch_add(1, Ordering::SeqCst);
+                        }
+                        if line.contains('?') && write_half.write_all(b"OK\n").await.is_err() {
+                            break;
+                        }
+                    }
+                    open.fetch_sub(1, Ordering::SeqCst);
+                });
+            }
+        });
+
+        (port, open, polls_after_reconnect)
+    }
+
+    #[test]
+    fn test_push_channel_commands() {
+        let mut batch = String::new();
+        NetworkManager::push_channel_commands(&mut batch, 3, 700_000, true).unwrap();
+        NetworkManager::push_channel_commands(&mut batch, 12, 1_640_000, false).unwrap();
+        assert_eq!(batch, "CH3:FREQ 700000\nCH3:OUTPUT ON\nCH12:FREQ 1640000\nCH12:OUTPUT OFF\n");
+
+        // Rejected before anything is appended
+        assert!(NetworkManager::push_channel_commands(&mut batch, 13, 700_000, true).is_err());
+        assert!(NetworkManager::push_channel_commands(&mut batch, 1, 1, true).is_err());
+        assert_eq!(batch.lines().count(), 4);
+    }
+
+    async fn wait_for_connection_state(nm: &NetworkManager, wanted: ConnectionState) -> bool {
+        for _ in 0..200 {
+            if nm.get_state().await.connection == wanted {
+                return true;
+            }
+            sleep(Duration::from_millis(50)).await;
+        }
+        false
+    }
+
+    #[tokio::test]
+    async fn test_polling_resumes_after_reconnect() {
+        let (port, _open, polls) = spawn_flaky_device().await;
+        let (tx, _rx) = broadcast::channel(100);
+        let nm = NetworkManager::new(tx);
+        nm.connect("127.0.0.1", port).await.unwrap();
+
+        assert!(wait_for_connection_state(&nm, ConnectionState::Reconnecting).await);
+        assert!(wait_for_connection_state(&nm, ConnectionState::Connected).await);
+
+        // The same poll task carries on over the new socket
+        for _ in 0..40 {
+            if polls.load(Ordering::SeqCst) >= 2 {
+                break;
+            }
+            sleep(Duration::from_millis(100)).await;
+        }
+        assert!(polls.load(Ordering::SeqCst) >= 2);
+
+        nm.disconnect().await.unwrap();
+    }
+
+    #[tokio::test]
+    async fn test_disconnect_during_reconnect_closes_link() {
+        let (port, open, _polls) = spawn_flaky_device().await;
+        let (tx, _rx) = broadcast::channel(100);
+        let nm = NetworkManager::new(tx);
+        nm.connect("127.0.0.1", port).await.unwrap();
+
+        assert!(wait_for_connection_state(&nm, ConnectionState::Reconnecting).await);
+        nm.disconnect().await.unwrap();
+
+        // Let the pending reconnect attempt run to completion
+        sleep(Duration::from_secs(Config::RECONNECT_DELAY_SECS + 1)).await;
+
+        assert_eq!(nm.get_state().await.connection, ConnectionState::Disconnected);
+        assert_eq!(open.load(Ordering::SeqCst), 0);
+    }
+}
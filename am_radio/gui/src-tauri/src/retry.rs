@@ -114,7 +114,8 @@ mod tests {
         assert_eq!(call_count, 1);
     }
 
-    #[tokio::test]
+    // Paused clock: the backoff sleeps auto-advance instead of waiting
+    #[tokio::test(start_paused = true)]
     async fn test_retry_succeeds_third_attempt() {
         let config = RetryConfig {
             max_attempts: 4,
@@ -139,7 +140,8 @@ mod tests {
         assert_eq!(call_count, 3);
     }
 
-    #[tokio::test]
+    // Paused clock: the backoff sleeps auto-advance instead of waiting
+    #[tokio::test(start_paused = true)]
     async fn test_retry_exhausted() {
         let config = RetryConfig {
             max_attempts: 3,
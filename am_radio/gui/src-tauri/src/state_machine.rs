@@ -157,11 +157,15 @@ pub enum WatchdogState {
 }
 
 impl WatchdogState {
+    /// Parse a status value, case-insensitively and without allocating
     pub fn from_status(value: &str) -> Self {
-        match value.to_uppercase().as_str() {
-            "0" | "OK" => WatchdogState::Ok,
-            "1" | "WARNING" => WatchdogState::Warning,
-            "2" | "TRIGGERED" => WatchdogState::Triggered,
+        match value {
+            "1" => WatchdogState::Warning,
+            "2" => WatchdogState::Triggered,
+            v if v.eq_ignore_ascii_case("WARNING") => WatchdogState::Warning,
+            v if v.eq_ignore_ascii_case("TRIGGERED") || v.eq_ignore_ascii_case("FAIL") => {
+                WatchdogState::Triggered
+            }
             _ => WatchdogState::Ok,
         }
     }
@@ -192,9 +196,10 @@ impl SourceMode {
     }
 
     pub fn from_str(s: &str) -> Self {
-        match s.to_uppercase().as_str() {
-            "ADC" => SourceMode::Adc,
-            _ => SourceMode::Bram,
+        if s.eq_ignore_ascii_case("ADC") {
+            SourceMode::Adc
+        } else {
+            SourceMode::Bram
         }
     }
 }
@@ -309,6 +314,9 @@ mod additional_tests {
         assert_eq!(WatchdogState::from_status("WARNING"), WatchdogState::Warning);
         assert_eq!(WatchdogState::from_status("1"), WatchdogState::Warning);
         assert_eq!(WatchdogState::from_status("TRIGGERED"), WatchdogState::Triggered);
+        assert_eq!(WatchdogState::from_status("2"), WatchdogState::Triggered);
+        assert_eq!(WatchdogState::from_status("FAIL"), WatchdogState::Triggered);
+        assert_eq!(WatchdogState::from_status("warning"), WatchdogState::Warning);
         assert_eq!(WatchdogState::from_status("garbage"), WatchdogState::Ok);
     }
 